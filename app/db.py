@@ -10,8 +10,15 @@ engine = create_engine(
     echo=False
 )
 
-# Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Session factory. Objects keep their loaded state after commit: primary keys
+# come back from the INSERT and column defaults are set client-side, so
+# freshly created rows serialize without a follow-up SELECT (db.refresh).
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine
+)
 
 # Base class for models
 Base = declarative_base()
@@ -28,4 +35,10 @@ def get_db():
 
 def init_db():
     """Initialize database tables."""
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    Base.metadata.create_all(bind=engine)
+    
+    # create_all skips tables that already exist, so also add any indexes
+    # introduced after those tables were first created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
\ No newline at end of file
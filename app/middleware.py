@@ -0,0 +1,48 @@
+"""ASGI middleware."""
+from typing import Iterable
+
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Allowance for multipart boundaries, part headers and other form fields
+_MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject oversized uploads from their Content-Length before the body is read.
+
+    FastAPI parses multipart forms before the endpoint runs, so a size check
+    inside the route only fires after the whole upload has been spooled.
+    Requests without a Content-Length (chunked) pass through; the importer
+    still enforces the cap while streaming the file.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: Iterable[str],
+        max_size_mb: int,
+        overhead_bytes: int = _MULTIPART_OVERHEAD_BYTES
+    ):
+        self.app = app
+        self.paths = frozenset(paths)
+        self.max_size_mb = max_size_mb
+        # Content-Length covers the whole multipart body, not just the file
+        self.max_bytes = max_size_mb * 1024 * 1024 + overhead_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.paths:
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_bytes:
+                        response = ORJSONResponse(
+                            status_code=413,
+                            content={
+                                "detail": f"File size exceeds {self.max_size_mb}MB limit"
+                            }
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
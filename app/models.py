@@ -3,7 +3,7 @@ from datetime import datetime
 from enum import Enum as PyEnum
 from sqlalchemy import (
     Column, Integer, String, Float, Boolean, DateTime, 
-    ForeignKey, Enum, Text, CheckConstraint
+    ForeignKey, Enum, Text, CheckConstraint, Index
 )
 from sqlalchemy.orm import relationship
 from app.db import Base
@@ -67,6 +67,8 @@ class Expense(Base):
     
     __table_args__ = (
         CheckConstraint('amount >= 0', name='check_expense_amount_positive'),
+        # Backs per-user exports ordered newest first
+        Index('ix_expenses_user_created', user_id, created_at.desc()),
     )
 
 
@@ -90,6 +92,7 @@ class DebtAccount(Base):
         CheckConstraint('annual_rate_pct >= 0', name='check_rate_positive'),
         CheckConstraint('term_months >= 1', name='check_term_positive'),
         CheckConstraint('current_emi >= 0', name='check_emi_positive'),
+        Index('ix_debt_accounts_user_start', user_id, start_date.desc()),
     )
 
 
@@ -111,6 +114,7 @@ class Goal(Base):
     __table_args__ = (
         CheckConstraint('target_amount >= 0', name='check_target_positive'),
         CheckConstraint('saved_amount >= 0', name='check_saved_positive'),
+        Index('ix_goals_user_created', user_id, created_at.desc()),
     )
 
 
@@ -36,7 +36,7 @@ def ask_ai(
     goals = db.query(Goal).filter(Goal.user_id == user.id).all()
     ai_rules = user.ai_rules  # may be None
 
-    meta = get_ai_meta()
+    meta = dict(get_ai_meta())
     meta.update({
         "intent": intent.value,
         "regulated_mode": settings.IS_REGULATED_PARTNER
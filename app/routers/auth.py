@@ -1,10 +1,19 @@
 """Authentication routes: register, login, profile."""
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from typing import Optional
+from fastapi import APIRouter, Cookie, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 from app.db import get_db
 from app.models import User
 from app.schemas import UserRegister, UserLogin, Token, UserProfile
-from app.security import hash_password, verify_password, create_access_token, get_current_user
+from app.security import (
+    hash_password,
+    verify_password,
+    password_needs_rehash,
+    create_access_token,
+    decode_access_token,
+    get_current_user,
+    invalidate_user_cache
+)
 from app.services.audit import log_action
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -29,7 +38,6 @@ def register(user_data: UserRegister, db: Session = Depends(get_db)):
     
     db.add(new_user)
     db.commit()
-    db.refresh(new_user)
     
     log_action(db, "user_registered", new_user, {"email": new_user.email})
     
@@ -47,6 +55,11 @@ def login(user_data: UserLogin, response: Response, db: Session = Depends(get_db
             detail="Incorrect email or password"
         )
     
+    # Transparently upgrade legacy bcrypt hashes to argon2id
+    rehashed = password_needs_rehash(user.password_hash)
+    if rehashed:
+        user.password_hash = hash_password(user_data.password)
+    
     # Create token
     access_token = create_access_token(data={"sub": str(user.id)})
     
@@ -62,14 +75,22 @@ def login(user_data: UserLogin, response: Response, db: Session = Depends(get_db
     )
     
     log_action(db, "user_login", user)
+    if rehashed:
+        # After log_action's commit, so a concurrent miss can't re-cache the old hash
+        invalidate_user_cache(user.id)
     
     # Return token for localStorage (fallback)
     return {"access_token": access_token, "token_type": "bearer"}
 
 
 @router.post("/logout")
-def logout(response: Response):
+def logout(response: Response, access_token: Optional[str] = Cookie(None)):
     """Logout by clearing cookie."""
+    if access_token:
+        try:
+            invalidate_user_cache(int(decode_access_token(access_token)["sub"]))
+        except (HTTPException, KeyError, TypeError, ValueError):
+            pass  # Expired or malformed token: nothing cached to drop
     response.delete_cookie("access_token", path="/")
     return {"message": "Logged out successfully"}
 
@@ -1,5 +1,7 @@
 """Data import/export routes."""
-from typing import List
+import re
+from collections import defaultdict
+from typing import BinaryIO, Dict, Tuple
 
 from fastapi import (
     APIRouter,
@@ -10,6 +12,7 @@ from fastapi import (
     UploadFile,
     status
 )
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.db import get_db
@@ -21,10 +24,16 @@ from app.models import (
     Goal,
     TransactionImport
 )
-from app.schemas import CSVUploadResponse, ExportResponse
+from app.schemas import (
+    CSVUploadResponse,
+    DebtResponse,
+    ExpenseResponse,
+    ExportResponse,
+    GoalResponse
+)
 from app.security import get_current_user
 from app.services.audit import log_action
-from app.services.imports import parse_bank_statement_csv, validate_csv_size
+from app.services.imports import iter_bank_statement_rows
 from app.settings import settings
 
 router = APIRouter(prefix="/data", tags=["data"])
@@ -44,80 +53,119 @@ _FIXED_KEYWORDS = {
     "subscription"
 }
 
+# One case-insensitive pass over the text instead of a substring scan per
+# keyword. Only the leading edge is anchored so plurals ("loans") still match
+# but words that merely contain a keyword ("premium", "parent") do not.
+# Underscores count as separators, so slugs like "home_rent" match.
+_FIXED_RE = re.compile(
+    r"(?<![^\W_])(?:" + "|".join(re.escape(w) for w in sorted(_FIXED_KEYWORDS)) + r")",
+    re.IGNORECASE
+)
+
 
 def _infer_expense_type(category: str, description: str) -> ExpenseType:
     """Heuristically label imported expenses as fixed or variable."""
-    text = f"{category} {description}".lower()
-    for keyword in _FIXED_KEYWORDS:
-        if keyword in text:
-            return ExpenseType.FIXED
+    if _FIXED_RE.search(f"{category} {description}"):
+        return ExpenseType.FIXED
     return ExpenseType.VARIABLE
 
 
-@router.post("/import-csv", response_model=CSVUploadResponse, status_code=status.HTTP_201_CREATED)
-async def import_csv(
-    file: UploadFile = File(...),
-    has_header: bool = Form(True),
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
-) -> CSVUploadResponse:
-    """Import a bank statement CSV and convert rows into expenses."""
+# Rows buffered per bulk INSERT while streaming an import
+_IMPORT_BATCH_SIZE = 1000
 
-    if not file.filename.lower().endswith(".csv"):
-        raise HTTPException(status_code=400, detail="Only CSV files are supported")
+# Rows fetched per cursor batch when exporting
+_EXPORT_BATCH_SIZE = 500
 
-    contents = await file.read()
 
-    try:
-        validate_csv_size(len(contents), settings.MAX_CSV_SIZE_MB)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-
-    try:
-        transactions, category_totals = parse_bank_statement_csv(contents, has_header)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-
-    rows_processed = len(transactions)
+def _store_import(
+    db: Session,
+    user: User,
+    filename: str,
+    stream: BinaryIO,
+    has_header: bool
+) -> Tuple[int, int]:
+    """Stream CSV rows into expenses and persist the import record."""
+    rows_processed = 0
     expenses_added = 0
-
-    for txn in transactions:
-        amount = float(txn.get("amount", 0))
+    category_totals: Dict[str, float] = defaultdict(float)
+
+    expense_rows = []
+    for txn in iter_bank_statement_rows(stream, has_header, settings.MAX_CSV_SIZE_MB):
+        rows_processed += 1
+        amount = txn.amount
+        # Aggregate by category as rows stream past
+        category_totals[txn.category] += amount
         if amount <= 0:
             continue
 
-        description = txn.get("description") or "Imported Expense"
-        category = txn.get("category") or "Uncategorized"
+        description = txn.description or "Imported Expense"
+        category = txn.category or "Uncategorized"
 
-        expense = Expense(
-            user_id=user.id,
-            name=description[:255],
-            amount=round(abs(amount), 2),
-            type=_infer_expense_type(category, description)
-        )
-        db.add(expense)
-        expenses_added += 1
+        expense_rows.append({
+            "user_id": user.id,
+            "name": description[:255],
+            "amount": round(abs(amount), 2),
+            "type": _infer_expense_type(category, description)
+        })
+
+        if len(expense_rows) >= _IMPORT_BATCH_SIZE:
+            # Executemany INSERT; skips per-instance ORM state tracking
+            db.bulk_insert_mappings(Expense, expense_rows)
+            expenses_added += len(expense_rows)
+            expense_rows = []
+
+    db.bulk_insert_mappings(Expense, expense_rows)
+    expenses_added += len(expense_rows)
 
     db.add(TransactionImport(
         user_id=user.id,
-        csv_filename=file.filename,
+        csv_filename=filename,
         processed_count=rows_processed
     ))
 
-    db.commit()
-
     log_action(
         db,
         "csv_imported",
         user,
         {
-            "filename": file.filename,
+            "filename": filename,
             "rows_processed": rows_processed,
             "expenses_added": expenses_added,
-            "categories": category_totals
-        }
+            "categories": dict(category_totals)
+        },
+        commit=False
     )
 
+    # Expenses, import record and audit entry share a single transaction
+    db.commit()
+
+    return rows_processed, expenses_added
+
+
+@router.post("/import-csv", response_model=CSVUploadResponse, status_code=status.HTTP_201_CREATED)
+async def import_csv(
+    file: UploadFile = File(...),
+    has_header: bool = Form(True),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user)
+) -> CSVUploadResponse:
+    """Import a bank statement CSV and convert rows into expenses."""
+
+    if not file.filename.lower().endswith(".csv"):
+        raise HTTPException(status_code=400, detail="Only CSV files are supported")
+
+    # Rows are decoded and inserted straight from the spooled upload, so
+    # the file is never held in memory as one blob. The size cap is enforced
+    # while reading; a rejected import rolls back with the session.
+    # This work runs in the threadpool so the event loop is not stalled
+    # by the blocking SQLAlchemy session I/O.
+    try:
+        rows_processed, expenses_added = await run_in_threadpool(
+            _store_import, db, user, file.filename, file.file, has_header
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
     message = (
         f"Imported {expenses_added} expenses from {file.filename}. "
         "Please review entries for accuracy."
@@ -138,27 +186,30 @@ def export_data(
 ) -> ExportResponse:
     """Export a snapshot of the user's finances."""
 
-    expenses: List[Expense] = (
+    # Rows are streamed from the cursor in batches while the response
+    # models are built, rather than materialized as full lists first.
+    # Each query is an index range scan on its (user_id, date DESC) index.
+    expenses = (
         db.query(Expense)
         .filter(Expense.user_id == user.id)
         .order_by(Expense.created_at.desc())
-        .all()
+        .yield_per(_EXPORT_BATCH_SIZE)
     )
-    debts: List[DebtAccount] = (
+    debts = (
         db.query(DebtAccount)
         .filter(DebtAccount.user_id == user.id)
         .order_by(DebtAccount.start_date.desc())
-        .all()
+        .yield_per(_EXPORT_BATCH_SIZE)
     )
-    goals: List[Goal] = (
+    goals = (
         db.query(Goal)
         .filter(Goal.user_id == user.id)
         .order_by(Goal.created_at.desc())
-        .all()
+        .yield_per(_EXPORT_BATCH_SIZE)
     )
 
     return ExportResponse(
-        expenses=expenses,
-        debts=debts,
-        goals=goals
-    )
\ No newline at end of file
+        expenses=[ExpenseResponse.model_validate(e) for e in expenses],
+        debts=[DebtResponse.model_validate(d) for d in debts],
+        goals=[GoalResponse.model_validate(g) for g in goals]
+    )
@@ -10,7 +10,7 @@ from app.schemas import (
     DebtCreate, DebtResponse,
     GoalCreate, GoalResponse
 )
-from app.security import get_current_user
+from app.security import get_current_user, invalidate_user_cache
 from app.services.audit import log_action
 
 router = APIRouter(prefix="/profile", tags=["profile"])
@@ -35,7 +35,7 @@ def update_profile(
         setattr(user, field, value)
     
     db.commit()
-    db.refresh(user)
+    invalidate_user_cache(user.id)
     
     log_action(db, "profile_updated", user, update_data)
     
@@ -68,7 +68,6 @@ def create_expense(
     )
     db.add(new_expense)
     db.commit()
-    db.refresh(new_expense)
     
     log_action(db, "expense_created", user, {"name": expense.name, "amount": expense.amount})
     
@@ -126,7 +125,6 @@ def create_debt(
     )
     db.add(new_debt)
     db.commit()
-    db.refresh(new_debt)
     
     log_action(db, "debt_created", user, {"name": debt.name, "principal": debt.principal})
     
@@ -183,7 +181,6 @@ def create_goal(
     )
     db.add(new_goal)
     db.commit()
-    db.refresh(new_goal)
     
     log_action(db, "goal_created", user, {"name": goal.name, "target": goal.target_amount})
     
@@ -1,5 +1,5 @@
 """Pydantic schemas for request/response validation."""
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 from typing import List, Optional
 from datetime import datetime
 import re
@@ -54,8 +54,7 @@ class UserProfile(BaseModel):
     monthly_net_income: float
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserProfileUpdate(BaseModel):
@@ -83,8 +82,7 @@ class ExpenseResponse(BaseModel):
     type: str
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============= Debt Schemas =============
@@ -108,8 +106,7 @@ class DebtResponse(BaseModel):
     current_emi: float
     start_date: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============= Goal Schemas =============
@@ -133,8 +130,7 @@ class GoalResponse(BaseModel):
     priority: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============= Calculation Schemas =============
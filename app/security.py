@@ -1,21 +1,26 @@
 """Security utilities: password hashing, JWT tokens."""
+import threading
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, Optional
+import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends, Cookie
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
 from app.settings import settings
 from app.db import get_db
 from app.models import User
 
-# Password hashing with explicit bcrypt rounds
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__rounds=12  # Explicit rounds, prevent auto-tuning issues
-)
+# Password hashing: argon2id for new hashes, bcrypt kept to verify legacy ones.
+# Hashes written earlier through passlib use the same standard formats.
+password_hasher = PasswordHasher()
+ARGON2_PREFIX = "$argon2"
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
 
 # JWT Bearer
 security = HTTPBearer(auto_error=False)
@@ -26,6 +31,17 @@ ALGORITHM = "HS256"
 # Bcrypt has a 72-byte limit, so we truncate safely
 MAX_PASSWORD_LENGTH = 72
 
+# Short-lived cache of user column values keyed by user id, so authenticated
+# requests skip the per-request user SELECT. Only plain column values are
+# cached (never the ORM instance itself, which belongs to a single session).
+USER_CACHE_TTL_SECONDS = 30
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL_SECONDS)
+_user_cache_lock = threading.Lock()
+# Bumped by every invalidation; a miss only fills the cache if no
+# invalidation ran while its SELECT was in flight
+_user_cache_epoch = 0
+_USER_COLUMNS = tuple(attr.key for attr in inspect(User).column_attrs)
+
 
 def _prepare_password(password: str) -> bytes:
     """
@@ -40,15 +56,34 @@ def _prepare_password(password: str) -> bytes:
 
 
 def hash_password(password: str) -> str:
-    """Hash a password using bcrypt with 72-byte safe truncation."""
-    password_bytes = _prepare_password(password)
-    return pwd_context.hash(password_bytes)
+    """Hash the full password using argon2id (no length limit)."""
+    return password_hasher.hash(password.encode('utf-8'))
 
 
 def verify_password(plain: str, hashed: str) -> bool:
-    """Verify a password against its hash."""
-    password_bytes = _prepare_password(plain)
-    return pwd_context.verify(password_bytes, hashed)
+    """Verify a password against its argon2id or legacy bcrypt hash."""
+    if hashed.startswith(ARGON2_PREFIX):
+        try:
+            return password_hasher.verify(hashed, plain.encode('utf-8'))
+        except (VerificationError, InvalidHashError):
+            return False
+    if hashed.startswith(BCRYPT_PREFIXES):
+        try:
+            # Legacy bcrypt hashes were made from the 72-byte-truncated password
+            return bcrypt.checkpw(_prepare_password(plain), hashed.encode('utf-8'))
+        except ValueError:
+            return False
+    return False
+
+
+def password_needs_rehash(hashed: str) -> bool:
+    """Check whether a stored hash is legacy bcrypt or uses outdated argon2 parameters."""
+    if not hashed.startswith(ARGON2_PREFIX):
+        return True
+    try:
+        return password_hasher.check_needs_rehash(hashed)
+    except InvalidHashError:
+        return True
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -75,6 +110,39 @@ def decode_access_token(token: str) -> dict:
         )
 
 
+def invalidate_user_cache(user_id: int) -> None:
+    """Drop a cached user entry; call after committing a change to the user's row."""
+    global _user_cache_epoch
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+        _user_cache_epoch += 1
+
+
+def _load_user(db: Session, user_id: int) -> Optional[User]:
+    """Load a user, reusing cached column values when still fresh."""
+    with _user_cache_lock:
+        cached: Optional[Dict[str, Any]] = _user_cache.get(user_id)
+        epoch = _user_cache_epoch
+    
+    if cached is not None:
+        user = db.identity_map.get(identity_key(User, user_id))
+        if user is None:
+            # Rebuild a persistent instance in this session without a SELECT
+            user = User(**cached)
+            make_transient_to_detached(user)
+            db.add(user)
+        return user
+    
+    user = db.query(User).filter(User.id == user_id).first()
+    if user is not None:
+        values = {key: getattr(user, key) for key in _USER_COLUMNS}
+        with _user_cache_lock:
+            # The row may predate a commit whose invalidation ran meanwhile
+            if epoch == _user_cache_epoch:
+                _user_cache[user_id] = values
+    return user
+
+
 def get_current_user(
     db: Session = Depends(get_db),
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
@@ -111,7 +179,7 @@ def get_current_user(
             detail="Invalid token subject"
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = _load_user(db, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
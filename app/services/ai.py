@@ -36,7 +36,7 @@ class AIProvider:
         self.base_url = settings.AI_BASE_URL
         self.model = settings.AI_MODEL
         self.api_key = settings.AI_API_KEY
-        self.system_prompt = settings.AI_SYSTEM_PROMPT.strip()
+        self.system_prompt = settings.system_prompt.strip()
         if self.provider == "huggingface":
             self.is_configured = bool(self.api_key and self.model)
         else:
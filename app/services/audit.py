@@ -1,15 +1,22 @@
 """Audit logging service."""
-import json
+import re
 from typing import Optional, Dict, Any
+import orjson
 from sqlalchemy.orm import Session
 from app.models import AuditLog, User
 
+# PII patterns, compiled once at import
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# Bangladesh mobile numbers
+_PHONE_RE = re.compile(r'\b(\+?880|0)?1[3-9]\d{8}\b')
+
 
 def log_action(
     db: Session,
     action: str,
     user: Optional[User] = None,
-    payload: Optional[Dict[str, Any]] = None
+    payload: Optional[Dict[str, Any]] = None,
+    commit: bool = True
 ) -> AuditLog:
     """
     Log an auditable action.
@@ -19,11 +26,15 @@ def log_action(
         action: Action description
         user: User performing action (optional)
         payload: Additional data (will be JSON-serialized)
+        commit: Commit immediately; pass False to only flush so the entry
+            lands in the caller's transaction and the caller commits once
         
     Returns:
         Created audit log entry
     """
-    payload_json = json.dumps(payload or {}, default=str)
+    payload_json = orjson.dumps(
+        payload or {}, default=str, option=orjson.OPT_NON_STR_KEYS
+    ).decode('utf-8')
     
     log_entry = AuditLog(
         user_id=user.id if user else None,
@@ -32,8 +43,10 @@ def log_action(
     )
     
     db.add(log_entry)
-    db.commit()
-    db.refresh(log_entry)
+    if commit:
+        db.commit()
+    else:
+        db.flush()
     
     return log_entry
 
@@ -49,10 +62,9 @@ def redact_pii(text: str) -> str:
         Text with PII redacted
     """
     # Simple email redaction
-    import re
-    text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[EMAIL_REDACTED]', text)
+    text = _EMAIL_RE.sub('[EMAIL_REDACTED]', text)
     
     # Redact potential phone numbers (Bangladesh format)
-    text = re.sub(r'\b(\+?880|0)?1[3-9]\d{8}\b', '[PHONE_REDACTED]', text)
+    text = _PHONE_RE.sub('[PHONE_REDACTED]', text)
     
     return text
\ No newline at end of file
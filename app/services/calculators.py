@@ -2,6 +2,44 @@
 import math
 from typing import Optional
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Numeric kernels. With an explicit signature numba compiles these eagerly at
+# import time, and cache=True persists the machine code next to the module so
+# later worker boots load it from disk instead of recompiling.
+
+# (1+r)^n is evaluated once as exp(n*log1p(r)); expm1 gives (1+r)^n - 1
+# without cancellation, which keeps near-zero rates accurate.
+
+@njit("float64(float64, float64, int64)", cache=True, fastmath=True)
+def _emi_core(principal, monthly_rate, term_months):
+    log_growth = term_months * math.log1p(monthly_rate)
+    growth_minus_one = math.expm1(log_growth)
+    if growth_minus_one == 0:
+        return 0.0
+    return principal * monthly_rate * math.exp(log_growth) / growth_minus_one
+
+
+@njit("float64(float64, float64, int64)", cache=True, fastmath=True)
+def _principal_from_emi_core(emi_value, monthly_rate, term_months):
+    if monthly_rate == 0:
+        return 0.0
+    # ((1+r)^n - 1) / (1+r)^n == 1 - (1+r)^-n
+    return emi_value * -math.expm1(-term_months * math.log1p(monthly_rate)) / monthly_rate
+
+
+@njit("float64(float64, float64, int64)", cache=True, fastmath=True)
+def _inflation_projection_core(current_cost, rate, years):
+    return current_cost * math.pow(1 + rate, years)
+
 
 def dti(monthly_debt: float, monthly_income: float) -> float:
     """
@@ -42,13 +80,7 @@ def emi(principal: float, annual_rate_pct: float, term_months: int) -> float:
         return principal / term_months
     
     monthly_rate = annual_rate_pct / 100 / 12
-    numerator = principal * monthly_rate * math.pow(1 + monthly_rate, term_months)
-    denominator = math.pow(1 + monthly_rate, term_months) - 1
-    
-    if denominator == 0:
-        return 0.0
-    
-    return numerator / denominator
+    return _emi_core(float(principal), monthly_rate, int(term_months))
 
 
 def principal_from_emi(emi_value: float, annual_rate_pct: float, term_months: int) -> float:
@@ -73,13 +105,7 @@ def principal_from_emi(emi_value: float, annual_rate_pct: float, term_months: in
         return emi_value * term_months
     
     monthly_rate = annual_rate_pct / 100 / 12
-    numerator = emi_value * (math.pow(1 + monthly_rate, term_months) - 1)
-    denominator = monthly_rate * math.pow(1 + monthly_rate, term_months)
-    
-    if denominator == 0:
-        return 0.0
-    
-    return numerator / denominator
+    return _principal_from_emi_core(float(emi_value), monthly_rate, int(term_months))
 
 
 def required_emi_to_finish(
@@ -123,7 +149,7 @@ def inflation_projection(
         raise ValueError("Cost and years must be non-negative")
     
     rate = annual_cpi_pct / 100
-    return current_cost * math.pow(1 + rate, years)
+    return _inflation_projection_core(float(current_cost), rate, int(years))
 
 
 def safe_to_spend(
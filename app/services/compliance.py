@@ -1,5 +1,6 @@
 """Compliance utilities and disclaimers."""
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 # Educational disclaimer for all financial calculations
 CALC_DISCLAIMER = (
@@ -53,24 +54,31 @@ FOOTER_COMPLIANCE_HTML = """
 """
 
 
-def get_calc_meta() -> Dict[str, str]:
-    """Get metadata dict with calculation disclaimer."""
-    return {"disclaimer": CALC_DISCLAIMER}
+# Precomputed, read-only meta payloads shared across requests
+_CALC_META = MappingProxyType({"disclaimer": CALC_DISCLAIMER})
+_LOAN_META = MappingProxyType({"disclaimer": f"{CALC_DISCLAIMER} {LOAN_DISCLAIMER}"})
+_AI_META = MappingProxyType({"disclaimer": AI_DISCLAIMER})
+_PROJECTION_META = MappingProxyType({"disclaimer": f"{CALC_DISCLAIMER} {PROJECTION_DISCLAIMER}"})
 
 
-def get_loan_meta() -> Dict[str, str]:
-    """Get metadata dict with loan disclaimer."""
-    return {"disclaimer": f"{CALC_DISCLAIMER} {LOAN_DISCLAIMER}"}
+def get_calc_meta() -> Mapping[str, str]:
+    """Get read-only metadata with calculation disclaimer."""
+    return _CALC_META
 
 
-def get_ai_meta() -> Dict[str, str]:
-    """Get metadata dict with AI disclaimer."""
-    return {"disclaimer": AI_DISCLAIMER}
+def get_loan_meta() -> Mapping[str, str]:
+    """Get read-only metadata with loan disclaimer."""
+    return _LOAN_META
 
 
-def get_projection_meta() -> Dict[str, str]:
-    """Get metadata dict with projection disclaimer."""
-    return {"disclaimer": f"{CALC_DISCLAIMER} {PROJECTION_DISCLAIMER}"}
+def get_ai_meta() -> Mapping[str, str]:
+    """Get read-only metadata with AI disclaimer."""
+    return _AI_META
+
+
+def get_projection_meta() -> Mapping[str, str]:
+    """Get read-only metadata with projection disclaimer."""
+    return _PROJECTION_META
 
 
 def check_regulated_feature(is_regulated: bool, feature_name: str) -> None:
@@ -1,74 +1,440 @@
 """CSV import parsing and processing."""
 import csv
 import io
-from typing import Dict, List, Tuple
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from math import isfinite
+from typing import (
+    TYPE_CHECKING, Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, NamedTuple,
+    Optional, Tuple
+)
 from datetime import datetime
 
+import numpy as np
+
+from app.settings import settings
+
+if TYPE_CHECKING:
+    # Imported on first use instead: the import route streams rows with csv,
+    # so app startup never pays for pandas
+    import pandas as pd
+
+try:
+    from fastnumbers import try_float
+except ImportError:  # fastnumbers is optional; fall back to float()
+    try_float = None
+
+try:
+    import peak_finance_csv as _native_csv
+except ImportError:  # native parser is optional; see native/peak_finance_csv
+    _native_csv = None
+
+# Recognized statement columns and the value used when a file lacks one
+_STATEMENT_COLUMNS: Dict[str, str] = {
+    'date': '',
+    'description': 'Unknown',
+    'category': 'Uncategorized',
+    'amount': '0'
+}
+
+# Characters stripped from amounts before float conversion: a translate
+# table for the per-row path and the equivalent regex for the vectorized one
+_AMOUNT_TRANS = str.maketrans('', '', '৳$,\t ')
+_AMOUNT_RE = re.compile(r'[৳$,\s]')
+
+# A line of only spaces/tabs: pandas skips it as blank, csv yields it as a row
+_WHITESPACE_LINE_RE = re.compile(rb'(?:^(?:\xef\xbb\xbf)?|[\r\n])[ \t]+(?:[\r\n]|$)')
+
+
+def _not_utf8_error(error: UnicodeDecodeError) -> ValueError:
+    """Describe a decode failure; files are always read strictly as utf-8-sig."""
+    return ValueError(f"Failed to parse CSV: file is not UTF-8 encoded text ({error.reason})")
+
+
+# Amounts must be finite: inf/nan would be stored and break JSON export.
+# Literal "inf"/"nan" are rejected at parse time; overflow such as "1e999"
+# still parses to inf, hence the isfinite check on the result.
+if try_float is not None:
+    def _to_amount(text: str) -> float:
+        """Convert a cleaned amount to float, 0.0 if unparseable (fastnumbers)."""
+        value = try_float(text, inf=0.0, nan=0.0, on_fail=0.0)
+        return value if isfinite(value) else 0.0
+else:
+    # Decimal or scientific notation; guards float() so bad cells never raise
+    _NUMBER_RE = re.compile(r'\s*[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?\s*')
+    
+    def _to_amount(text: str) -> float:
+        """Convert a cleaned amount to float, 0.0 if unparseable."""
+        value = float(text) if _NUMBER_RE.fullmatch(text) else 0.0
+        return value if isfinite(value) else 0.0
+
+
+class Transaction(NamedTuple):
+    """One statement row; a tuple, so no per-row dict is allocated."""
+    
+    date: str
+    description: str
+    category: str
+    amount: float
+
+
+@dataclass(frozen=True)
+class StatementColumns:
+    """Parsed statement as parallel columns rather than per-row dicts."""
+    
+    dates: np.ndarray
+    descriptions: np.ndarray
+    categories: "pd.Categorical"
+    amounts: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+
+class _SizeLimitedReader(io.RawIOBase):
+    """Raw binary reader that enforces the CSV size cap as bytes are read."""
+    
+    def __init__(self, stream: BinaryIO, max_size_mb: Optional[int] = None):
+        self._stream = stream
+        self._max_size_mb = max_size_mb
+        self._bytes_read = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        data = self._stream.read(len(buffer))
+        size = len(data)
+        self._bytes_read += size
+        if self._max_size_mb is not None:
+            validate_csv_size(self._bytes_read, self._max_size_mb)
+        buffer[:size] = data
+        return size
+
+
+def _open_text(stream: BinaryIO, max_size_mb: Optional[int] = None) -> io.TextIOWrapper:
+    """
+    Wrap a binary stream for csv without decoding it up front.
+    
+    TextIOWrapper decodes buffered chunks in C as the reader pulls lines;
+    utf-8-sig strips a leading BOM and newline='' leaves line endings to csv.
+    """
+    return io.TextIOWrapper(
+        io.BufferedReader(_SizeLimitedReader(stream, max_size_mb)),
+        encoding='utf-8-sig',
+        newline=''
+    )
+
+
+@lru_cache(maxsize=32)
+def _make_row_parser(
+    header_key: Tuple[str, ...]
+) -> Callable[[Iterable[List[str]]], Iterator[Transaction]]:
+    """
+    Generate a row parser specialized to one normalized header layout.
+    
+    Uploads from the same bank repeat the same column order, so the column
+    positions are baked into the generated loop as literals and missing
+    columns become constant defaults. Only integer indices and repr() of
+    the module defaults are ever placed in the generated source.
+    """
+    index = {name: i for i, name in enumerate(header_key)}
+    present = [index[column] for column in _STATEMENT_COLUMNS if column in index]
+    
+    def cell(column: str) -> str:
+        if column in index:
+            return f"row[{index[column]}].strip()"
+        return repr(_STATEMENT_COLUMNS[column])
+    
+    if 'amount' in index:
+        # Currency symbols, commas and blanks removed in one pass
+        amount = f"_to_amount(row[{index['amount']}].translate(_AMOUNT_TRANS))"
+    else:
+        amount = repr(_to_amount(_STATEMENT_COLUMNS['amount']))
+    
+    lines = [
+        "def parse_rows(rows):",
+        "    for row in rows:",
+        "        if not row:",
+        "            continue",
+    ]
+    if present:
+        # Ragged rows read missing cells as empty strings
+        needed = max(present) + 1
+        lines += [
+            f"        if len(row) < {needed}:",
+            f"            row = row + [''] * {needed}",
+        ]
+    lines += [
+        # tuple.__new__ skips the generated NamedTuple constructor
+        "        yield _new(Transaction, (",
+        f"            {cell('date')},",
+        f"            {cell('description')},",
+        f"            {cell('category')},",
+        f"            {amount},",
+        "        ))",
+    ]
+    
+    namespace = {
+        '_new': tuple.__new__,
+        'Transaction': Transaction,
+        '_to_amount': _to_amount,
+        '_AMOUNT_TRANS': _AMOUNT_TRANS
+    }
+    exec("\n".join(lines), namespace)
+    return namespace['parse_rows']
+
+
+def iter_bank_statement_rows(
+    stream: BinaryIO,
+    has_header: bool = True,
+    max_size_mb: Optional[int] = None
+) -> Iterator[Transaction]:
+    """
+    Stream transactions from a bank statement CSV without buffering the file.
+    
+    Expected columns: date, description, category (optional), amount
+    (header names match case-insensitively, ignoring surrounding whitespace)
+    
+    Args:
+        stream: Binary file object positioned at the start of the CSV
+        has_header: Whether first row is header
+        max_size_mb: Abort with ValueError once more than this many MB are read
+        
+    Yields:
+        Transaction tuples with date, description, category and amount
+        
+    Raises:
+        ValueError: If the file is too large or cannot be decoded/parsed
+    """
+    reader = csv.reader(_open_text(stream, max_size_mb))
+    
+    try:
+        # Blank lines before the header are skipped, as for data rows
+        header = next((row for row in reader if row), None)
+        if header is None:
+            return
+        
+        parse_rows = _make_row_parser(tuple(name.strip().lower() for name in header))
+        yield from parse_rows(reader)
+    except UnicodeDecodeError as e:
+        raise _not_utf8_error(e) from e
+    except csv.Error as e:
+        raise ValueError(f"Failed to parse CSV: {str(e)}") from e
+
+
+def _strip_categories(series: "pd.Series") -> "pd.Series":
+    """Strip whitespace from a categorical column by touching only its categories."""
+    stripped = series.cat.categories.str.strip()
+    if stripped.is_unique:
+        return series.cat.rename_categories(stripped)
+    # " Food" and "Food" collapse into one label, so the codes must be rebuilt
+    return series.astype(str).str.strip().astype('category')
+
+
+@lru_cache(maxsize=1)
+def _sum_by_code_kernel() -> Callable[[np.ndarray, np.ndarray, int], np.ndarray]:
+    """Build the per-code sum kernel on first use, so importing loads no numba."""
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; totals fall back to np.bincount
+        def sum_by_code(codes: np.ndarray, amounts: np.ndarray, n_codes: int) -> np.ndarray:
+            """Sum amounts per categorical code with one weighted bincount."""
+            return np.bincount(codes, weights=amounts, minlength=n_codes)
+        return sum_by_code
+    
+    # Serial on purpose: a prange scatter-add into `totals` would race
+    @njit("float64[:](intp[:], float64[:], int64)", cache=True)
+    def sum_by_code(codes, amounts, n_codes):
+        """Sum amounts per categorical code in one compiled pass."""
+        totals = np.zeros(n_codes)
+        for i in range(codes.shape[0]):
+            totals[codes[i]] += amounts[i]
+        return totals
+    return sum_by_code
+
+
+def _ordered_totals(categories: "pd.Categorical", totals: np.ndarray) -> Dict[str, float]:
+    """Map per-code totals to labels, in first-seen order like a dict built row by row."""
+    import pandas as pd
+    
+    seen = pd.unique(categories.codes)
+    return dict(zip(categories.categories[seen].tolist(), totals[seen].tolist()))
+
+
+def _category_totals(columns: StatementColumns) -> Dict[str, float]:
+    """Sum amounts per category as a reduction over the categorical codes."""
+    codes = columns.categories.codes.astype(np.intp)
+    sum_by_code = _sum_by_code_kernel()
+    totals = sum_by_code(codes, columns.amounts, len(columns.categories.categories))
+    return _ordered_totals(columns.categories, totals)
+
+
+def _frame_from_rows(
+    rows: Iterable[List[str]],
+    indices: Dict[str, int],
+    dtypes: Dict[str, Any]
+) -> "pd.DataFrame":
+    """Build the frame read_csv would give from csv rows, keyed by positional label."""
+    import pandas as pd
+    
+    # Blank lines are skipped and ragged rows read missing cells as empty
+    # strings, as in the streaming parser
+    fill = [''] * (max(indices.values(), default=-1) + 1)
+    records = [row + fill for row in rows if row]
+    frame = pd.DataFrame(
+        {label: [record[i] for record in records] for label, i in indices.items()},
+        index=pd.RangeIndex(len(records))
+    )
+    return frame.astype(dtypes) if dtypes else frame
+
+
+def _read_statement_frame(file_content: bytes) -> "pd.DataFrame":
+    """
+    Tokenize one statement into the four normalized columns.
+    
+    Text columns come back stripped and missing columns filled with their
+    defaults; amounts are still raw strings (see _to_statement_columns).
+    """
+    import pandas as pd
+    
+    try:
+        # Read the header with csv so raw names arrive unmangled (pandas
+        # renames duplicates to "x.1"); blank lines before it are skipped
+        reader = csv.reader(_open_text(io.BytesIO(file_content)))
+        header = next((row for row in reader if row), None)
+        if header is None:
+            return pd.DataFrame(
+                {column: pd.Series([], dtype=object) for column in _STATEMENT_COLUMNS}
+            )
+        
+        # Normalize each header name once; when two raw names normalize to
+        # the same column the last one wins, as in the streaming parser
+        positions = {name.strip().lower(): i for i, name in enumerate(header)}
+        columns = {
+            f'c{i}': name for name, i in positions.items()
+            if name in _STATEMENT_COLUMNS
+        }
+        # Low-cardinality category is parsed straight into a Categorical so
+        # totals reduce over small integer codes, not strings
+        dtypes = {
+            label: 'category' if name == 'category' else str
+            for label, name in columns.items()
+        }
+        
+        if _WHITESPACE_LINE_RE.search(file_content):
+            # pandas would drop whitespace-only lines that the streaming
+            # parser yields as rows; such files are rare, so only they are
+            # tokenized row by row with csv
+            indices = {label: positions[name] for label, name in columns.items()}
+            df = _frame_from_rows(reader, indices, dtypes)
+        else:
+            df = pd.read_csv(
+                io.BytesIO(file_content),
+                header=0,
+                # Positional labels replace the raw header row
+                names=[f'c{i}' for i in range(len(header))],
+                # With no recognized column, read the first one just to keep
+                # one (default-filled) row per record
+                usecols=list(columns) or ['c0'],
+                dtype=dtypes or str,
+                # Extra cells on long rows are dropped, never taken as an index
+                index_col=False,
+                encoding='utf-8-sig',
+                engine='c',
+                na_filter=False
+            )
+        df = df.rename(columns=columns)
+    
+    except UnicodeDecodeError as e:
+        raise _not_utf8_error(e) from e
+    except (csv.Error, pd.errors.ParserError) as e:
+        raise ValueError(f"Failed to parse CSV: {str(e)}") from e
+    
+    # Fill columns the file doesn't have and strip the ones it does
+    for column, default in _STATEMENT_COLUMNS.items():
+        if column not in df.columns:
+            df[column] = default
+        elif column == 'category':
+            df[column] = _strip_categories(df[column])
+        else:
+            df[column] = df[column].str.strip()
+    return df[list(_STATEMENT_COLUMNS)]
+
+
+def _to_statement_columns(df: "pd.DataFrame") -> StatementColumns:
+    """Convert a frame from _read_statement_frame into typed columns."""
+    import pandas as pd
+    
+    # Remove currency symbols, commas and whitespace
+    cleaned = df['amount'].str.replace(_AMOUNT_RE, '', regex=True)
+    amounts = pd.to_numeric(cleaned, errors='coerce').to_numpy(dtype=np.float64)
+    # to_numeric only reads ASCII digits, so cells it rejects (e.g. Bengali
+    # "১৫,০০০") go through _to_amount like the streamed ones
+    unparsed = np.isnan(amounts)
+    if unparsed.any():
+        amounts[unparsed] = [_to_amount(text) for text in cleaned[unparsed].tolist()]
+    # Non-finite amounts -> 0.0, as in _to_amount
+    amounts[~np.isfinite(amounts)] = 0.0
+    
+    return StatementColumns(
+        dates=df['date'].to_numpy(dtype=object),
+        descriptions=df['description'].to_numpy(dtype=object),
+        categories=df['category'].astype('category').array,
+        amounts=amounts
+    )
+
 
 def parse_bank_statement_csv(
     file_content: bytes,
-    has_header: bool = True
-) -> Tuple[List[Dict[str, str]], Dict[str, float]]:
+    has_header: bool = True,
+    return_transactions: bool = True
+) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
     """
     Parse bank statement CSV.
     
     Expected columns: date, description, category (optional), amount
+    (header names match case-insensitively, ignoring surrounding whitespace)
+    
+    The whole buffer is tokenized by pandas' C parser and the amount
+    cleaning and category aggregation run as vectorized column operations.
+    When the optional peak_finance_csv extension is installed and
+    USE_NATIVE_CSV_PARSER is set, the whole parse runs natively instead.
+    Use iter_bank_statement_rows to stream a file without buffering it.
     
     Args:
         file_content: CSV file bytes
         has_header: Whether first row is header
+        return_transactions: Build the per-row transactions list; pass False
+            when only category totals are needed (an empty list is returned)
         
     Returns:
         Tuple of (transactions list, category totals dict)
-    """
-    try:
-        # Decode with UTF-8, fallback to UTF-8-SIG for BOM
-        try:
-            content = file_content.decode('utf-8')
-        except UnicodeDecodeError:
-            content = file_content.decode('utf-8-sig')
-        
-        reader = csv.DictReader(io.StringIO(content))
         
-        transactions = []
-        category_totals: Dict[str, float] = {}
-        
-        for row in reader:
-            # Normalize keys
-            row = {k.strip().lower(): v.strip() for k, v in row.items()}
-            
-            # Extract fields
-            date_str = row.get('date', '')
-            description = row.get('description', 'Unknown')
-            category = row.get('category', 'Uncategorized')
-            amount_str = row.get('amount', '0')
-            
-            # Parse amount
-            try:
-                # Remove currency symbols and commas
-                amount_clean = amount_str.replace('৳', '').replace(',', '').strip()
-                amount = float(amount_clean)
-            except ValueError:
-                amount = 0.0
-            
-            transaction = {
-                'date': date_str,
-                'description': description,
-                'category': category,
-                'amount': amount
-            }
-            
-            transactions.append(transaction)
-            
-            # Aggregate by category
-            if category not in category_totals:
-                category_totals[category] = 0.0
-            category_totals[category] += amount
-        
-        return transactions, category_totals
+    Raises:
+        ValueError: If the file cannot be decoded/parsed
+    """
+    if _native_csv is not None and settings.USE_NATIVE_CSV_PARSER:
+        # Raises ValueError("Failed to parse CSV: ...") itself
+        return _native_csv.parse_bank_csv(file_content, return_transactions)
+    
+    columns = _to_statement_columns(_read_statement_frame(file_content))
+    category_totals = _category_totals(columns)
+    if not return_transactions:
+        return [], category_totals
     
-    except Exception as e:
-        raise ValueError(f"Failed to parse CSV: {str(e)}")
+    # Zip the columns back into per-row transaction dicts
+    transactions = [
+        {'date': date, 'description': description, 'category': category, 'amount': amount}
+        for date, description, category, amount in zip(
+            columns.dates.tolist(),
+            columns.descriptions.tolist(),
+            columns.categories.tolist(),
+            columns.amounts.tolist()
+        )
+    ]
+    return transactions, category_totals
 
 
 def validate_csv_size(file_size: int, max_size_mb: int = 5) -> None:
@@ -3,10 +3,11 @@ from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from pathlib import Path
 
 from app.db import init_db
+from app.middleware import UploadSizeLimitMiddleware
 from app.settings import settings
 from app.routers import auth, profile, data, calc, ai
 
@@ -17,7 +18,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json"
+    openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse
 )
 
 # Mount static files
@@ -26,6 +28,14 @@ app.mount("/static", StaticFiles(directory="app/static"), name="static")
 # Templates
 templates = Jinja2Templates(directory="app/templates")
 
+# Reject oversized CSV uploads before the multipart body is spooled.
+# Registered before CORS so CORS wraps it and its 413 keeps the CORS headers.
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    paths=["/api/data/import-csv"],
+    max_size_mb=settings.MAX_CSV_SIZE_MB,
+)
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -0,0 +1,274 @@
+//! Native bank statement CSV parser for Peak Finance.
+//!
+//! Mirrors `app.services.imports.iter_bank_statement_rows`: same column
+//! normalization, defaults, amount cleaning and category aggregation (kept in
+//! step by tests/test_parser_parity.py), but the
+//! decode -> split -> clean -> float -> aggregate loop runs without the
+//! interpreter and with the GIL released.
+
+use std::collections::HashMap;
+
+use pyo3::exceptions::PyValueError;
+use pyo3::intern;
+use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyList};
+
+/// Recognized statement columns, in output order.
+const COLUMNS: [&str; 4] = ["date", "description", "category", "amount"];
+/// Value used when the file lacks the corresponding column.
+const DEFAULTS: [&str; 4] = ["", "Unknown", "Uncategorized", "0"];
+
+const DATE: usize = 0;
+const DESCRIPTION: usize = 1;
+const CATEGORY: usize = 2;
+const AMOUNT: usize = 3;
+
+struct Transaction {
+    date: String,
+    description: String,
+    category: String,
+    amount: f64,
+}
+
+#[derive(Default)]
+struct Parsed {
+    transactions: Vec<Transaction>,
+    /// Category totals in first-seen order, matching Python dict ordering.
+    category_totals: Vec<(String, f64)>,
+}
+
+/// Digit zero of every Unicode decimal digit block (Unicode 14.0, as in
+/// Python's unicodedata). Each block runs 0-9 in code point order.
+const DIGIT_ZEROS: [u32; 66] = [
+    0x0030, 0x0660, 0x06F0, 0x07C0, 0x0966, 0x09E6, 0x0A66, 0x0AE6, 0x0B66, 0x0BE6,
+    0x0C66, 0x0CE6, 0x0D66, 0x0DE6, 0x0E50, 0x0ED0, 0x0F20, 0x1040, 0x1090, 0x17E0,
+    0x1810, 0x1946, 0x19D0, 0x1A80, 0x1A90, 0x1B50, 0x1BB0, 0x1C40, 0x1C50, 0xA620,
+    0xA8D0, 0xA900, 0xA9D0, 0xA9F0, 0xAA50, 0xABF0, 0xFF10, 0x104A0, 0x10D30, 0x11066,
+    0x110F0, 0x11136, 0x111D0, 0x112F0, 0x11450, 0x114D0, 0x11650, 0x116C0, 0x11730,
+    0x118E0, 0x11950, 0x11C50, 0x11D50, 0x11DA0, 0x16A60, 0x16AC0, 0x16B50, 0x1D7CE,
+    0x1D7D8, 0x1D7E2, 0x1D7EC, 0x1D7F6, 0x1E140, 0x1E2F0, 0x1E950, 0x1FBF0,
+];
+
+/// ASCII form of a Unicode decimal digit (e.g. Bengali '১' -> '1').
+fn ascii_digit(c: char) -> Option<char> {
+    let code = c as u32;
+    let zero = match DIGIT_ZEROS.binary_search(&code) {
+        Ok(slot) => DIGIT_ZEROS[slot],
+        Err(0) => return None,
+        Err(slot) => DIGIT_ZEROS[slot - 1],
+    };
+    char::from_digit(code - zero, 10)
+}
+
+fn is_amount_noise(c: char) -> bool {
+    matches!(c, '৳' | '$' | ',') || c.is_whitespace()
+}
+
+/// Strip currency symbols, commas and whitespace, then parse.
+///
+/// Non-ASCII decimal digits read like their ASCII forms, as Python's float()
+/// does. Unparseable and non-finite values (inf, nan, overflow) become 0.0,
+/// as in the Python parsers.
+fn parse_amount(raw: &str) -> f64 {
+    let value: Result<f64, _> = if raw.chars().any(|c| !c.is_ascii() || is_amount_noise(c)) {
+        let cleaned: String = raw
+            .chars()
+            .filter(|&c| !is_amount_noise(c))
+            .map(|c| ascii_digit(c).unwrap_or(c))
+            .collect();
+        cleaned.parse()
+    } else {
+        raw.parse()
+    };
+    match value {
+        Ok(amount) if amount.is_finite() => amount,
+        _ => 0.0,
+    }
+}
+
+fn parse(data: &[u8], keep_transactions: bool) -> Result<Parsed, String> {
+    let data = data.strip_prefix(b"\xef\xbb\xbf").unwrap_or(data);
+    let text = std::str::from_utf8(data).map_err(|e| format!("file is not UTF-8 encoded text ({e})"))?;
+
+    let mut reader = csv::ReaderBuilder::new()
+        .has_headers(false)
+        .flexible(true)
+        .from_reader(text.as_bytes());
+    let mut records = reader.records();
+
+    let mut parsed = Parsed::default();
+    if keep_transactions {
+        // One row per line is an upper bound (minus the header), so the
+        // vector is allocated once instead of regrowing while parsing
+        let lines = text.bytes().filter(|&b| b == b'\n').count();
+        parsed.transactions.reserve_exact(lines);
+    }
+    // The csv crate already skips blank lines, so the first record is the
+    // header even when the file starts with empty lines
+    let header = match records.next() {
+        Some(record) => record.map_err(|e| e.to_string())?,
+        None => return Ok(parsed),
+    };
+
+    // Resolve column positions once from the normalized header
+    let mut index: [Option<usize>; 4] = [None; 4];
+    for (position, name) in header.iter().enumerate() {
+        let name = name.trim().to_lowercase();
+        if let Some(column) = COLUMNS.iter().position(|c| *c == name) {
+            index[column] = Some(position);
+        }
+    }
+
+    let mut totals_index: HashMap<String, usize> = HashMap::new();
+
+    for record in records {
+        let record = record.map_err(|e| e.to_string())?;
+        // Ragged rows read missing cells as empty strings
+        let field = |column: usize| -> &str {
+            match index[column] {
+                Some(position) => record.get(position).unwrap_or("").trim(),
+                None => DEFAULTS[column],
+            }
+        };
+
+        let category = field(CATEGORY);
+        let amount = parse_amount(field(AMOUNT));
+
+        match totals_index.get(category) {
+            Some(&slot) => parsed.category_totals[slot].1 += amount,
+            None => {
+                totals_index.insert(category.to_owned(), parsed.category_totals.len());
+                parsed.category_totals.push((category.to_owned(), amount));
+            }
+        }
+
+        if keep_transactions {
+            parsed.transactions.push(Transaction {
+                date: field(DATE).to_owned(),
+                description: field(DESCRIPTION).to_owned(),
+                category: category.to_owned(),
+                amount,
+            });
+        }
+    }
+
+    Ok(parsed)
+}
+
+/// Parse bank statement CSV bytes into (transactions, category_totals).
+///
+/// Raises ValueError if the data is not valid UTF-8 or not parseable CSV.
+#[pyfunction]
+#[pyo3(signature = (data, return_transactions = true))]
+fn parse_bank_csv<'py>(
+    py: Python<'py>,
+    data: &[u8],
+    return_transactions: bool,
+) -> PyResult<(Bound<'py, PyList>, Bound<'py, PyDict>)> {
+    let parsed = py
+        .allow_threads(|| parse(data, return_transactions))
+        .map_err(|e| PyValueError::new_err(format!("Failed to parse CSV: {e}")))?;
+
+    let mut rows = Vec::with_capacity(parsed.transactions.len());
+    for txn in parsed.transactions {
+        let row = PyDict::new_bound(py);
+        row.set_item(intern!(py, "date"), txn.date)?;
+        row.set_item(intern!(py, "description"), txn.description)?;
+        row.set_item(intern!(py, "category"), txn.category)?;
+        row.set_item(intern!(py, "amount"), txn.amount)?;
+        rows.push(row);
+    }
+    // Exact-size list, allocated once
+    let transactions = PyList::new_bound(py, rows);
+
+    let category_totals = PyDict::new_bound(py);
+    for (category, total) in parsed.category_totals {
+        category_totals.set_item(category, total)?;
+    }
+
+    Ok((transactions, category_totals))
+}
+
+#[pymodule]
+fn peak_finance_csv(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(parse_bank_csv, m)?)?;
+    Ok(())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn cleans_amounts() {
+        assert_eq!(parse_amount("৳15,000"), 15000.0);
+        assert_eq!(parse_amount(" $1,000.25 "), 1000.25);
+        assert_eq!(parse_amount("abc"), 0.0);
+        assert_eq!(parse_amount(""), 0.0);
+        assert_eq!(parse_amount("1e3"), 1000.0);
+        assert_eq!(parse_amount("1_000"), 0.0);
+    }
+
+    #[test]
+    fn reads_unicode_digits() {
+        assert_eq!(parse_amount("৳১৫,০০০"), 15000.0);
+        assert_eq!(parse_amount("١٢٣"), 123.0);
+        assert_eq!(parse_amount("১e২"), 100.0);
+        assert_eq!(ascii_digit('e'), None);
+        assert_eq!(ascii_digit('٩'), Some('9'));
+    }
+
+    #[test]
+    fn non_finite_amounts_are_zero() {
+        for raw in ["inf", "-Infinity", "nan", "NaN", "1e999"] {
+            assert_eq!(parse_amount(raw), 0.0, "{raw}");
+        }
+    }
+
+    #[test]
+    fn skips_blank_lines_before_header() {
+        let parsed = parse(b"\n\r\nDate,Amount\n1,500\n", true).unwrap();
+        assert_eq!(parsed.transactions.len(), 1);
+        assert_eq!(parsed.transactions[0].date, "1");
+        assert_eq!(parsed.transactions[0].amount, 500.0);
+    }
+
+    #[test]
+    fn keeps_whitespace_only_lines() {
+        let parsed = parse(b"date,amount\n1,5\n \n\t\r\n2,6\n", true).unwrap();
+        assert_eq!(parsed.transactions.len(), 4);
+        assert_eq!(parsed.transactions[1].date, "");
+        assert_eq!(parsed.transactions[2].amount, 0.0);
+    }
+
+    #[test]
+    fn duplicate_headers_last_column_wins() {
+        let parsed = parse(b"amount,Amount\n5,6\n", true).unwrap();
+        assert_eq!(parsed.transactions[0].amount, 6.0);
+    }
+
+    #[test]
+    fn no_known_columns_yields_default_rows() {
+        let parsed = parse(b"foo,bar\n1,2\n3,4\n", true).unwrap();
+        assert_eq!(parsed.transactions.len(), 2);
+        assert_eq!(parsed.transactions[0].category, "Uncategorized");
+    }
+
+    #[test]
+    fn fills_defaults_and_aggregates() {
+        let data = "\u{feff} Date ,Amount,Category\n1,5,Food\n2,\"1,000\",Food\n\n3,x\n";
+        let parsed = parse(data.as_bytes(), true).unwrap();
+        assert_eq!(parsed.transactions.len(), 3);
+        assert_eq!(parsed.transactions[0].description, "Unknown");
+        assert_eq!(parsed.transactions[2].category, "");
+        assert_eq!(
+            parsed.category_totals,
+            vec![("Food".to_owned(), 1005.0), ("".to_owned(), 0.0)]
+        );
+    }
+
+    #[test]
+    fn rejects_invalid_utf8() {
+        assert!(parse(b"a,b\n\xff,1\n", true).is_err());
+    }
+}
@@ -0,0 +1,59 @@
+"""Tests for the calculation routes."""
+import itertools
+import math
+import random
+
+import pytest
+
+from app.routers.calc import _simulate_payoff
+
+
+def _iterative_payoff(principal, annual_rate_pct, monthly_payment, max_months=1200):
+    """The month-by-month simulation _simulate_payoff replaced."""
+    if monthly_payment <= 0 or principal <= 0:
+        return 0, 0.0
+    
+    monthly_rate = annual_rate_pct / 100 / 12
+    balance = principal
+    months = 0
+    total_interest = 0.0
+    
+    while balance > 0 and months < max_months:
+        interest = balance * monthly_rate if monthly_rate > 0 else 0.0
+        principal_payment = monthly_payment - interest
+        if principal_payment <= 0:
+            break
+        balance -= principal_payment
+        if balance < 1e-6:
+            balance = 0.0
+        total_interest += interest
+        months += 1
+    
+    return months, total_interest
+
+
+def _cases():
+    grid = itertools.product(
+        [0.3, 1_000, 50_000, 250_000.5, 1_500_000],
+        [0, 0.5, 7, 9.5, 12, 24],
+        [0.1, 100, 1_234.56, 5_000, 25_000, 2_000_000]
+    )
+    rng = random.Random(1)
+    randomized = [
+        (round(rng.uniform(1, 2e6), 2), rng.choice([0, round(rng.uniform(0, 30), 2)]),
+         round(rng.uniform(1, 1e5), 2))
+        for _ in range(300)
+    ]
+    # Payments that divide the principal exactly, where float error could
+    # push the count one month over
+    exact = [(p * k, rate, p) for p in (0.1, 0.7, 333.33, 1_000) for k in (3, 7, 12, 360)
+             for rate in (0, 6)]
+    return list(grid) + randomized + exact
+
+
+@pytest.mark.parametrize("principal, rate, payment", _cases())
+def test_closed_form_payoff_matches_iterative_simulation(principal, rate, payment):
+    months, interest = _simulate_payoff(principal, rate, payment)
+    expected_months, expected_interest = _iterative_payoff(principal, rate, payment)
+    assert months == expected_months
+    assert math.isclose(interest, expected_interest, rel_tol=1e-6, abs_tol=1e-6)
@@ -0,0 +1,64 @@
+"""Parity tests: every CSV parser applies the same rules to the same input."""
+import io
+import os
+
+import pytest
+
+from app.services import imports
+from app.services.imports import iter_bank_statement_rows, parse_bank_statement_csv
+
+EDGE_CASES = {
+    "basic": b"date,description,category,amount\n2024-01-01,Rent,Housing,500\n",
+    "bom_and_padded_headers": b"\xef\xbb\xbf Date , DESCRIPTION ,Amount\n1, Coffee ,250.5\n",
+    "blank_leading_lines": b"\n\r\nDate,Description,Amount\n1,Rent,500\n",
+    "blank_lines_between_rows": b"date,amount\n1,5\n\n2,6\n",
+    "no_known_columns": b"foo,bar\n1,2\n3,4\n",
+    "header_only": b"date,description,category,amount\n",
+    "empty": b"",
+    "duplicate_headers": b"date,amount,Amount\n1,5,6\n2,7\n",
+    "ragged_rows": b"date,description,amount\n1,short\n2,long,3,extra,cells\n",
+    "currency_and_grouping": b'date,amount\n1,"\xe0\xa7\xb315,000"\n2,"$1,000.25"\n3, 7 \n',
+    "non_numeric_amounts": b"date,amount\n1,nan\n2,inf\n3,-Infinity\n4,1e999\n5,1_000\n6,abc\n7,\n",
+    "numeric_forms": b"date,amount\n1,1e3\n2,.5\n3,5.\n4,+3\n5,-2\n",
+    "category_whitespace": b"date,category,amount\n1,Food,1\n2, Food ,2\n3,Rent,3\n",
+    "quoted_multiline": b'date,description,amount\n1,"multi\nline",5\n',
+    "unicode_digits": "date,amount\n1,\"৳১৫,০০০\"\n2,١٢٣\n3,১e২\n4,۱.۵\n".encode(),
+    "whitespace_only_lines": b"date,category,amount\n1,Food,5\n \n\t\r\n2,Rent,6\n",
+    "whitespace_line_before_header": b" \ndate,amount\n1,5\n",
+    "whitespace_in_quoted_field": b'date,description,amount\n1,"a\n  \nb",5\n',
+}
+
+
+def _streaming(content):
+    rows = [row._asdict() for row in iter_bank_statement_rows(io.BytesIO(content))]
+    totals = {}
+    for row in rows:
+        totals[row['category']] = totals.get(row['category'], 0.0) + row['amount']
+    return rows, totals
+
+
+def _pandas(content):
+    # USE_NATIVE_CSV_PARSER is off by default, so this is the pandas path
+    return parse_bank_statement_csv(content)
+
+
+def _native(content):
+    if imports._native_csv is None:
+        if os.environ.get("REQUIRE_NATIVE_CSV"):
+            pytest.fail("REQUIRE_NATIVE_CSV is set but peak_finance_csv is not installed")
+        pytest.skip("peak_finance_csv extension is not installed")
+    return imports._native_csv.parse_bank_csv(content, True)
+
+
+PARSERS = {"pandas": _pandas, "native": _native}
+
+
+@pytest.mark.parametrize("case", list(EDGE_CASES))
+@pytest.mark.parametrize("parser", list(PARSERS))
+def test_parser_matches_streaming(parser, case):
+    content = EDGE_CASES[case]
+    expected_rows, expected_totals = _streaming(content)
+    rows, totals = PARSERS[parser](content)
+    assert rows == expected_rows
+    # Same categories in the same first-seen order
+    assert list(totals.items()) == list(expected_totals.items())
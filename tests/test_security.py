@@ -0,0 +1,132 @@
+"""Tests for password hashing and the authenticated user cache."""
+import bcrypt
+import pytest
+from cachetools import TTLCache
+from sqlalchemy import event
+
+from app import security
+from app.db import SessionLocal, engine
+from app.models import User
+from app.security import (
+    hash_password,
+    invalidate_user_cache,
+    password_needs_rehash,
+    verify_password
+)
+
+
+def test_argon2_hash_round_trip():
+    hashed = hash_password("Passw0rdX")
+    assert hashed.startswith("$argon2id$")
+    assert verify_password("Passw0rdX", hashed)
+    assert not verify_password("Passw0rdY", hashed)
+    assert not password_needs_rehash(hashed)
+
+
+def test_argon2_uses_full_password_beyond_72_bytes():
+    hashed = hash_password("A" * 72 + "y")
+    assert verify_password("A" * 72 + "y", hashed)
+    assert not verify_password("A" * 72 + "x", hashed)
+
+
+def test_legacy_bcrypt_hash_verifies_truncated_password():
+    legacy = bcrypt.hashpw(("B" * 72).encode("utf-8"), bcrypt.gensalt(rounds=4)).decode()
+    assert verify_password("B" * 72 + "extra", legacy)
+    assert not verify_password("B" * 71, legacy)
+    assert password_needs_rehash(legacy)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Give each test an empty user cache driven by a fake clock."""
+    now = [0.0]
+    cache = TTLCache(maxsize=16, ttl=security.USER_CACHE_TTL_SECONDS, timer=lambda: now[0])
+    monkeypatch.setattr(security, "_user_cache", cache)
+    return now
+
+
+@pytest.fixture
+def user_id(client):
+    with SessionLocal() as db:
+        user = User(email="cached@example.com", password_hash=hash_password("Passw0rdX"))
+        db.add(user)
+        db.commit()
+        yield user.id
+        db.delete(user)
+        db.commit()
+
+
+@pytest.fixture
+def selects():
+    """Count user SELECTs issued while the test runs."""
+    statements = []
+    
+    def record(conn, cursor, statement, *args):
+        if statement.lstrip().startswith("SELECT") and "FROM users" in statement:
+            statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def _load(user_id):
+    with SessionLocal() as db:
+        return security._load_user(db, user_id).email
+
+
+def test_user_cache_hit_skips_select(clock, user_id, selects):
+    assert _load(user_id) == "cached@example.com"
+    assert _load(user_id) == "cached@example.com"
+    assert len(selects) == 1
+
+
+def test_invalidate_user_cache_forces_reload(clock, user_id, selects):
+    _load(user_id)
+    invalidate_user_cache(user_id)
+    _load(user_id)
+    assert len(selects) == 2
+
+
+def test_user_cache_entries_expire(clock, user_id, selects):
+    _load(user_id)
+    clock[0] += security.USER_CACHE_TTL_SECONDS - 1
+    _load(user_id)
+    assert len(selects) == 1
+    clock[0] += 2
+    _load(user_id)
+    assert len(selects) == 2
+
+
+def test_invalidation_during_select_is_not_overwritten(clock, user_id, selects):
+    # Another request commits and invalidates while this miss is reading the row
+    def invalidate(*args):
+        invalidate_user_cache(user_id)
+    
+    event.listen(engine, "after_cursor_execute", invalidate)
+    try:
+        _load(user_id)
+    finally:
+        event.remove(engine, "after_cursor_execute", invalidate)
+    assert user_id not in security._user_cache
+
+
+def test_profile_update_visible_on_next_request(clock, client, auth_headers):
+    assert client.get("/api/profile", headers=auth_headers).status_code == 200
+    client.post("/api/profile", json={"currency": "USD"}, headers=auth_headers)
+    assert client.get("/api/profile", headers=auth_headers).json()["currency"] == "USD"
+
+
+def test_login_rehash_invalidates_after_commit(clock, client):
+    legacy = bcrypt.hashpw(b"Passw0rdX", bcrypt.gensalt(rounds=4)).decode()
+    with SessionLocal() as db:
+        user = User(email="legacy@example.com", password_hash=legacy)
+        db.add(user)
+        db.commit()
+        security._load_user(db, user.id)
+    
+    credentials = {"email": "legacy@example.com", "password": "Passw0rdX"}
+    assert client.post("/api/auth/login", json=credentials).status_code == 200
+    assert user.id not in security._user_cache
+    with SessionLocal() as db:
+        assert security._load_user(db, user.id).password_hash.startswith("$argon2id$")